@@ -13,36 +13,58 @@ Usage:
 
 Requirements:
     pip install jsonschema
+    pip install orjson  # optional, speeds up JSON parsing
 """
 
+import functools
+import itertools
 import json
+import mmap
 import sys
-import argparse
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from types import SimpleNamespace
+from typing import Dict, Iterator, List, Tuple
 
 try:
-    from jsonschema import validate, ValidationError, Draft7Validator
+    import orjson
+    _loads = orjson.loads
+    _JSONError = orjson.JSONDecodeError
 except ImportError:
-    print("❌ Error: jsonschema is not installed")
-    print("Install with: pip install jsonschema")
-    sys.exit(1)
+    orjson = None
+    _loads = json.loads
+    _JSONError = json.JSONDecodeError
 
 
 # Record types supported by each provider
 SUPPORTED_RECORD_TYPES = {
-    'aws': [
+    'aws': frozenset({
         'A', 'AAAA', 'CAA', 'CNAME', 'MX', 'NAPTR', 'NS',
         'PTR', 'SOA', 'SPF', 'SRV', 'TXT'
-    ],
-    'cloudflare': [
+    }),
+    'cloudflare': frozenset({
         'A', 'AAAA', 'CAA', 'CNAME', 'HTTPS', 'TXT', 'SRV',
         'LOC', 'MX', 'NS', 'CERT', 'DNSKEY', 'DS', 'NAPTR',
         'SMIMEA', 'SSHFP', 'SVCB', 'TLSA', 'URI'
-    ],
-    'vercel': [
+    }),
+    'vercel': frozenset({
         'A', 'AAAA', 'ALIAS', 'CAA', 'CNAME', 'MX', 'SRV', 'TXT'
-    ]
+    })
+}
+
+# Maximum number of schema errors reported for a single file
+MAX_SCHEMA_ERRORS = 50
+
+# Record types that can be proxied (Cloudflare)
+PROXIED_OK = frozenset({'A', 'AAAA', 'CNAME'})
+
+# Compatibility warning templates, filled with (zone, name, *args) when printed
+_FMT = {
+    'TYPE_UNSUPPORTED': "  ⚠️  {}/{} - Type '{}' not supported by {}",
+    'PROXIED_CLOUDFLARE_ONLY': "  ⚠️  {}/{} - 'proxied' is only supported by Cloudflare",
+    'PROXIED_TYPE': "  ⚠️  {}/{} - 'proxied' only works with A, AAAA, CNAME",
+    'ALIAS_AWS_ONLY': "  ⚠️  {}/{} - 'alias' is only supported by AWS Route53",
+    'MX_PRIORITY': "  ⚠️  {}/{} - MX records require 'priority'",
 }
 
 
@@ -55,40 +77,88 @@ class Colors:
     NC = '\033[0m'  # No Color
 
 
+# Banners are built once and written with a single call
+_HEADER = (
+    f"{Colors.GREEN}\n"
+    "╔════════════════════════════════════════════════════════════════╗\n"
+    "║       DNS CONFIGURATION VALIDATOR                              ║\n"
+    "╚════════════════════════════════════════════════════════════════╝\n"
+    f"{Colors.NC}\n\n"
+)
+
+_SUCCESS_BANNER = (
+    f"{Colors.GREEN}╔════════════════════════════════════════════════════════════════╗{Colors.NC}\n"
+    f"{Colors.GREEN}║  ✅ VALIDATION COMPLETED SUCCESSFULLY                          ║{Colors.NC}\n"
+    f"{Colors.GREEN}╚════════════════════════════════════════════════════════════════╝{Colors.NC}\n"
+    "\n"
+    "✅ Configuration is valid and ready to use\n"
+    "\n"
+)
+
+
+@functools.lru_cache(maxsize=1)
 def load_schema() -> Dict:
-    """Load the JSON Schema"""
+    """Load the JSON Schema (parsed once and shared by the validators)"""
     schema_path = Path(__file__).parent.parent / 'schemas' / 'dns-config.schema.json'
 
     if not schema_path.exists():
         print(f"{Colors.RED}❌ Error: Schema not found at {schema_path}{Colors.NC}")
         sys.exit(1)
 
-    with open(schema_path, 'r') as f:
-        return json.load(f)
+    # Map the schema instead of copying it into a bytes buffer first
+    with open(schema_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+            mm.madvise(mmap.MADV_WILLNEED)
+        with memoryview(mm) as data:
+            # json.loads() only accepts str/bytes
+            return _loads(data if orjson else bytes(data))
 
 
 def load_config(config_file: str) -> Dict:
     """Load the JSON configuration file"""
     try:
-        with open(config_file, 'r') as f:
-            return json.load(f)
+        with open(config_file, 'rb') as f:
+            return _loads(f.read())
     except FileNotFoundError:
         print(f"{Colors.RED}❌ Error: File not found: {config_file}{Colors.NC}")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except _JSONError as e:
         print(f"{Colors.RED}❌ Error: Invalid JSON{Colors.NC}")
         print(f"   {e}")
         sys.exit(1)
 
 
-def validate_schema(config: Dict, schema: Dict) -> Tuple[bool, List[str]]:
+def _ensure_jsonschema():
+    """Exit with install instructions if jsonschema is missing"""
+    try:
+        import jsonschema  # noqa: F401
+    except ImportError:
+        print("❌ Error: jsonschema is not installed")
+        print("Install with: pip install jsonschema")
+        sys.exit(1)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_validator():
+    """Build the schema validator once and reuse it"""
+    # Imported lazily so that --help does not pay for it
+    from jsonschema import Draft7Validator
+
+    return Draft7Validator(load_schema())
+
+
+def validate_schema(config: Dict) -> Tuple[bool, List[str]]:
     """Validate configuration against the schema"""
     errors = []
 
     try:
-        validator = Draft7Validator(schema)
-        for error in validator.iter_errors(config):
+        validator = _get_validator()
+        error_iter = validator.iter_errors(config)
+        for error in itertools.islice(error_iter, MAX_SCHEMA_ERRORS):
             errors.append(f"  • {error.message} (path: {'.'.join(str(p) for p in error.path)})")
+        if next(error_iter, None) is not None:
+            errors.append(f"  • ... (more errors omitted, showing the first {MAX_SCHEMA_ERRORS})")
 
         return len(errors) == 0, errors
     except Exception as e:
@@ -96,86 +166,113 @@ def validate_schema(config: Dict, schema: Dict) -> Tuple[bool, List[str]]:
         return False, errors
 
 
-def check_provider_compatibility(config: Dict, provider: str = None) -> Tuple[bool, List[str]]:
-    """Check compatibility with providers"""
-    warnings = []
+def _iter_records(config: Dict, zones_list: List[Dict] = None) -> Iterator[Tuple[str, Dict]]:
+    """Yield (zone_key, record) pairs for every record in the configuration
 
+    If zones_list is given, a summary of each zone is appended to it as the
+    zones are visited, so statistics need no separate pass.
+    """
     for zone_key, zone_config in config.items():
-        for idx, record in enumerate(zone_config.get('records', [])):
-            record_type = record.get('type', '').upper()
+        records = zone_config.get('records', ())
+        if zones_list is not None:
+            zones_list.append({
+                'key': zone_key,
+                'domain': zone_config.get('domain'),
+                'records_count': len(records)
+            })
+        for record in records:
+            yield zone_key, record
+
+
+def analyze(config: Dict, providers: Tuple[str, ...] = tuple(SUPPORTED_RECORD_TYPES),
+            collect_warnings: bool = True) -> Tuple[Dict, Dict[str, List[Tuple]]]:
+    """Get statistics and compatibility warnings in a single pass over the records
+
+    Warnings are (zone, name, code, *args) tuples; see format_warning().
+    With collect_warnings=False a provider is no longer checked once one of
+    its records has produced a warning, so only pass/fail is reliable.
+    """
+    stats = {
+        'zones': len(config),
+        'total_records': 0,
+        'record_types': Counter(),
+        'zones_list': []
+    }
+    record_types = stats['record_types']
+    warnings_by_provider = {provider: [] for provider in providers}
+    checks = [
+        (provider, SUPPORTED_RECORD_TYPES[provider] if provider else None, warnings_by_provider[provider])
+        for provider in providers
+    ]
+
+    for zone_key, record in _iter_records(config, stats['zones_list']):
+        # Count record types
+        stats['total_records'] += 1
+        record_types[record.get('type', 'UNKNOWN')] += 1
+
+        # Statistics only (e.g. get_statistics()): skip the field reads
+        if not checks:
+            continue
+
+        record_type = record.get('type', '').upper()
+        name = record.get('name', '@')
+        proxied = record.get('proxied', False)
+        alias = record.get('alias')
+        priority = record.get('priority')
+
+        for provider, supported, warnings in checks:
+            if warnings and not collect_warnings:
+                continue
 
             # Check compatibility with specific provider
             if provider:
-                if record_type not in SUPPORTED_RECORD_TYPES[provider]:
-                    warnings.append(
-                        f"  ⚠️  {zone_key}/{record.get('name', '@')} - "
-                        f"Type '{record_type}' not supported by {provider}"
-                    )
+                if record_type not in supported:
+                    warnings.append((zone_key, name, 'TYPE_UNSUPPORTED', record_type, provider))
 
             # Check proxied (Cloudflare only)
-            if record.get('proxied', False):
+            if proxied:
                 if provider and provider != 'cloudflare':
-                    warnings.append(
-                        f"  ⚠️  {zone_key}/{record.get('name', '@')} - "
-                        f"'proxied' is only supported by Cloudflare"
-                    )
-                if record_type not in ['A', 'AAAA', 'CNAME']:
-                    warnings.append(
-                        f"  ⚠️  {zone_key}/{record.get('name', '@')} - "
-                        f"'proxied' only works with A, AAAA, CNAME"
-                    )
+                    warnings.append((zone_key, name, 'PROXIED_CLOUDFLARE_ONLY'))
+                if record_type not in PROXIED_OK:
+                    warnings.append((zone_key, name, 'PROXIED_TYPE'))
 
             # Check alias (AWS only)
-            if record.get('alias'):
+            if alias:
                 if provider and provider != 'aws':
-                    warnings.append(
-                        f"  ⚠️  {zone_key}/{record.get('name', '@')} - "
-                        f"'alias' is only supported by AWS Route53"
-                    )
+                    warnings.append((zone_key, name, 'ALIAS_AWS_ONLY'))
 
             # Check MX priority
-            if record_type == 'MX' and not record.get('priority'):
-                warnings.append(
-                    f"  ⚠️  {zone_key}/{record.get('name', '@')} - "
-                    f"MX records require 'priority'"
-                )
+            if record_type == 'MX' and not priority:
+                warnings.append((zone_key, name, 'MX_PRIORITY'))
 
-    return len(warnings) == 0, warnings
+    return stats, warnings_by_provider
 
 
-def get_statistics(config: Dict) -> Dict:
-    """Get configuration statistics"""
-    stats = {
-        'zones': len(config),
-        'total_records': 0,
-        'record_types': {},
-        'zones_list': []
-    }
+def check_provider_compatibility(config: Dict, provider: str = None,
+                                 collect_warnings: bool = True) -> Tuple[bool, List[str]]:
+    """Check compatibility with providers"""
+    _, warnings_by_provider = analyze(config, (provider,), collect_warnings)
+    warnings = warnings_by_provider[provider]
+    if not collect_warnings:
+        return len(warnings) == 0, []
+    return len(warnings) == 0, [format_warning(warning) for warning in warnings]
 
-    for zone_key, zone_config in config.items():
-        records = zone_config.get('records', [])
-        stats['total_records'] += len(records)
-        stats['zones_list'].append({
-            'key': zone_key,
-            'domain': zone_config.get('domain'),
-            'records_count': len(records)
-        })
 
-        # Count record types
-        for record in records:
-            record_type = record.get('type', 'UNKNOWN')
-            stats['record_types'][record_type] = stats['record_types'].get(record_type, 0) + 1
+def format_warning(warning: Tuple) -> str:
+    """Format a compatibility warning collected by analyze()"""
+    zone_key, name, code, *args = warning
+    return _FMT[code].format(zone_key, name, *args)
 
+
+def get_statistics(config: Dict) -> Dict:
+    """Get configuration statistics"""
+    stats, _ = analyze(config, ())
     return stats
 
 
 def print_header():
     """Print header"""
-    print(f"{Colors.GREEN}")
-    print("╔════════════════════════════════════════════════════════════════╗")
-    print("║       DNS CONFIGURATION VALIDATOR                              ║")
-    print("╚════════════════════════════════════════════════════════════════╝")
-    print(f"{Colors.NC}\n")
+    sys.stdout.write(_HEADER)
 
 
 def print_statistics(stats: Dict):
@@ -193,35 +290,104 @@ def print_statistics(stats: Dict):
     print()
 
 
+_USAGE = "usage: {prog} [-h] [--provider {{aws,cloudflare,vercel}}] [--strict]\n{indent}config_file\n"
+
+_LONG_OPTIONS = ('--help', '--provider', '--strict')
+
+_HELP = """
+Validate DNS configuration for the Terraform module
+
+positional arguments:
+  config_file           JSON configuration file
+
+options:
+  -h, --help            show this help message and exit
+  --provider {aws,cloudflare,vercel}
+                        Validate compatibility with a specific provider
+  --strict              Strict mode: fail if there are warnings
+"""
+
+
+def parse_args(argv: List[str]) -> SimpleNamespace:
+    """Parse command line arguments (argparse-compatible, without its startup cost)"""
+    prog = Path(sys.argv[0]).name
+    usage = _USAGE.format(prog=prog, indent=' ' * (len(prog) + 8))
+
+    def error(message: str):
+        sys.stderr.write(f"{usage}{prog}: error: {message}\n")
+        sys.exit(2)
+
+    args = SimpleNamespace(config_file=None, provider=None, strict=False)
+    unrecognized = []
+    remaining = iter(argv)
+
+    for arg in remaining:
+        option, has_value, value = arg.partition('=')
+
+        # Like argparse, accept unique prefixes of the long options
+        if option.startswith('--') and option != '--':
+            matches = [o for o in _LONG_OPTIONS if o.startswith(option)]
+            if len(matches) > 1:
+                error(f"ambiguous option: {option} could match {', '.join(matches)}")
+            if matches:
+                option = matches[0]
+        else:
+            option, has_value = arg, False
+
+        if option in ('-h', '--help'):
+            if has_value:
+                error(f"argument -h/--help: ignored explicit argument '{value}'")
+            sys.stdout.write(usage + _HELP)
+            sys.exit(0)
+        elif option == '--strict':
+            if has_value:
+                error(f"argument --strict: ignored explicit argument '{value}'")
+            args.strict = True
+        elif option == '--provider':
+            if not has_value:
+                value = next(remaining, None)
+                if value is None or value.startswith('-'):
+                    error("argument --provider: expected one argument")
+            if value not in SUPPORTED_RECORD_TYPES:
+                choices = ', '.join(f"'{p}'" for p in SUPPORTED_RECORD_TYPES)
+                error(f"argument --provider: invalid choice: '{value}' (choose from {choices})")
+            args.provider = value
+        elif arg == '--':
+            for arg in remaining:
+                if args.config_file is None:
+                    args.config_file = arg
+                else:
+                    unrecognized.append(arg)
+        elif arg.startswith('-') and arg != '-':
+            unrecognized.append(arg)
+        elif args.config_file is None:
+            args.config_file = arg
+        else:
+            unrecognized.append(arg)
+
+    if args.config_file is None:
+        error("the following arguments are required: config_file")
+    if unrecognized:
+        error(f"unrecognized arguments: {' '.join(unrecognized)}")
+
+    return args
+
+
 def main():
-    parser = argparse.ArgumentParser(
-        description='Validate DNS configuration for the Terraform module'
-    )
-    parser.add_argument('config_file', help='JSON configuration file')
-    parser.add_argument(
-        '--provider',
-        choices=['aws', 'cloudflare', 'vercel'],
-        help='Validate compatibility with a specific provider'
-    )
-    parser.add_argument(
-        '--strict',
-        action='store_true',
-        help='Strict mode: fail if there are warnings'
-    )
-
-    args = parser.parse_args()
+    args = parse_args(sys.argv[1:])
+    _ensure_jsonschema()
 
     print_header()
 
     # Load schema and configuration
     print(f"{Colors.YELLOW}🔍 Loading files...{Colors.NC}")
-    schema = load_schema()
+    load_schema()
     config = load_config(args.config_file)
     print(f"{Colors.GREEN}✓ Files loaded successfully{Colors.NC}\n")
 
     # Validate schema
     print(f"{Colors.YELLOW}🔍 Validating JSON structure...{Colors.NC}")
-    schema_valid, schema_errors = validate_schema(config, schema)
+    schema_valid, schema_errors = validate_schema(config)
 
     if schema_valid:
         print(f"{Colors.GREEN}✓ Valid JSON structure{Colors.NC}\n")
@@ -232,21 +398,23 @@ def main():
         print()
         sys.exit(1)
 
-    # Statistics
-    stats = get_statistics(config)
+    # Statistics and provider compatibility
+    providers = (args.provider,) if args.provider else tuple(SUPPORTED_RECORD_TYPES)
+    # Without --provider only pass/fail is reported, so skip building warnings
+    stats, warnings_by_provider = analyze(config, providers, collect_warnings=bool(args.provider))
     print_statistics(stats)
 
     # Check provider compatibility
     if args.provider:
         print(f"{Colors.YELLOW}🔍 Checking compatibility with {args.provider}...{Colors.NC}")
-        compat_ok, compat_warnings = check_provider_compatibility(config, args.provider)
+        compat_warnings = warnings_by_provider[args.provider]
 
-        if compat_ok:
+        if not compat_warnings:
             print(f"{Colors.GREEN}✓ Compatible with {args.provider}{Colors.NC}\n")
         else:
             print(f"{Colors.YELLOW}⚠️  Compatibility warnings with {args.provider}:{Colors.NC}")
             for warning in compat_warnings:
-                print(warning)
+                print(format_warning(warning))
             print()
 
             if args.strict:
@@ -255,20 +423,14 @@ def main():
     else:
         # Check general compatibility
         print(f"{Colors.YELLOW}🔍 Checking general compatibility...{Colors.NC}")
-        all_compat = True
-        for provider in ['aws', 'cloudflare', 'vercel']:
-            compat_ok, _ = check_provider_compatibility(config, provider)
+        for provider in providers:
+            compat_ok = not warnings_by_provider[provider]
             status = f"{Colors.GREEN}✓{Colors.NC}" if compat_ok else f"{Colors.YELLOW}⚠{Colors.NC}"
             print(f"  {status} {provider}")
         print()
 
     # Final result
-    print(f"{Colors.GREEN}╔════════════════════════════════════════════════════════════════╗{Colors.NC}")
-    print(f"{Colors.GREEN}║  ✅ VALIDATION COMPLETED SUCCESSFULLY                          ║{Colors.NC}")
-    print(f"{Colors.GREEN}╚════════════════════════════════════════════════════════════════╝{Colors.NC}")
-    print()
-    print(f"✅ Configuration is valid and ready to use")
-    print()
+    sys.stdout.write(_SUCCESS_BANNER)
 
 
 if __name__ == '__main__':